@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 from village_simulator.simulation.components.weather import (
     DRY_PROBABILITY,
@@ -11,7 +10,10 @@ from village_simulator.simulation.components.weather import (
     RAINFALL_SEASONALITY_MIN,
     RAINFALL_SEASONALITY_MIN_DATE,
 )
-from village_simulator.simulation.distributions import stretched_truncnorm_ppf
+from village_simulator.simulation.distributions import (
+    gamma_ppf,
+    stretched_truncnorm_ppf,
+)
 from village_simulator.simulation.utilities import get_value_from_annual_cycle
 
 
@@ -45,24 +47,23 @@ def sample_rainfall_in_period(
         index=aridity_factors.index,
         columns=pd.Index(range(num_years), name="year"),
     ).stack()
-    aridity_factors_values = aridity_factors.values[:, None]
+    aridity_factors_values = aridity_factors.to_numpy()
 
     # get zero_inflated_gamma_ppf parameters for each day in period
-    dry_probabilities = 1 - aridity_factors * (1 - DRY_PROBABILITY)
-    scale = aridity_factors * GAMMA_SCALE_PARAMETER
+    dry_probabilities = 1 - aridity_factors_values * (1 - DRY_PROBABILITY)
+    scale = aridity_factors_values * GAMMA_SCALE_PARAMETER
 
     # sample large number of observations for each day in period
-    is_dry_propensity = pd.Series(
-        np.random.rand(len(aridity_factors)), index=aridity_factors.index
-    )
-    not_dry_index = dry_probabilities[dry_probabilities >= is_dry_propensity].index
+    is_dry_propensity = np.random.rand(len(aridity_factors))
+    is_not_dry = dry_probabilities >= is_dry_propensity
 
-    regional_rainfall = pd.Series(0.0, index=aridity_factors.index)
-    regional_rainfall.loc[not_dry_index] = stats.gamma.ppf(
-        pd.Series(np.random.rand(len(not_dry_index)), index=not_dry_index),
-        a=GAMMA_SHAPE_PARAMETER,
-        scale=scale[not_dry_index],
+    regional_rainfall = np.zeros(len(aridity_factors))
+    regional_rainfall[is_not_dry] = gamma_ppf(
+        np.random.rand(is_not_dry.sum()),
+        shape=GAMMA_SHAPE_PARAMETER,
+        scale=scale[is_not_dry],
     )
+    regional_rainfall = pd.Series(regional_rainfall, index=aridity_factors.index)
 
     expected_rainfall = pd.DataFrame(
         np.broadcast_to(
@@ -1,13 +1,14 @@
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from scipy import stats
 from vivarium import Component
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
 from vivarium.framework.population import SimulantData
 
 from village_simulator.constants import Columns, Pipelines
+from village_simulator.simulation.distributions import normal_ppf
 from village_simulator.simulation.utilities import round_stochastic
 
 
@@ -55,6 +56,12 @@ class Demographics(Component):
     def setup(self, builder: Builder) -> None:
         self.configuration = builder.configuration.demographics
         self.randomness = builder.randomness.get_stream(self.name)
+
+        # Read the rate parameters out of the configuration tree once rather
+        # than traversing it on every time step
+        self._fertility_rate_parameters = self.configuration.fertility_rate.to_dict()
+        self._mortality_rate_parameters = self.configuration.mortality_rate.to_dict()
+
         self.get_fertility_rate = builder.value.register_rate_producer(
             Pipelines.FERTILITY_RATE, self.fertility_rate_source, requires_streams=[self.name]
         )
@@ -73,16 +80,10 @@ class Demographics(Component):
 
     def on_initialize_simulants(self, pop_data: SimulantData) -> None:
         state = self.population_view.subview([Columns.ARABLE_LAND]).get(pop_data.index)
-        village_size = pd.DataFrame(
-            0,
-            index=pop_data.index,
-            columns=[Columns.FEMALE_POPULATION_SIZE, Columns.MALE_POPULATION_SIZE],
-        )
-
         total_village_size = (
             self.randomness.sample_from_distribution(
                 state.index,
-                distribution=stats.norm,
+                ppf=normal_ppf,
                 additional_key="initial_village_size",
                 **self.configuration.initial_village_size.to_dict(),
             )
@@ -91,36 +92,47 @@ class Demographics(Component):
 
         sex_ratio = self.randomness.sample_from_distribution(
             state.index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="initial_sex_ratio",
             **self.configuration.initial_sex_ratio.to_dict(),
         )
 
-        village_size.loc[state.index, Columns.FEMALE_POPULATION_SIZE] = round_stochastic(
+        village_size = np.zeros((len(pop_data.index), 2), dtype=int)
+        village_rows = pop_data.index.get_indexer(state.index)
+        village_size[village_rows, 0] = round_stochastic(
             total_village_size * sex_ratio / 2.0,
             self.randomness,
             "initial_female_village_size",
-        )
-        village_size.loc[state.index, Columns.MALE_POPULATION_SIZE] = round_stochastic(
+        ).to_numpy()
+        village_size[village_rows, 1] = round_stochastic(
             total_village_size * (1.0 - sex_ratio / 2.0),
             self.randomness,
             "initial_male_village_size",
-        )
+        ).to_numpy()
 
-        self.population_view.update(village_size)
+        self.population_view.update(
+            pd.DataFrame(
+                village_size,
+                index=pop_data.index,
+                columns=[Columns.FEMALE_POPULATION_SIZE, Columns.MALE_POPULATION_SIZE],
+            )
+        )
 
     def on_time_step(self, event: Event) -> None:
         villages = self.population_view.get(event.index)[
             [Columns.FEMALE_POPULATION_SIZE, Columns.MALE_POPULATION_SIZE]
         ]
 
-        fertility_rate = self.get_fertility_rate(villages.index)
-        births = fertility_rate.mul(villages[Columns.FEMALE_POPULATION_SIZE], axis=0)
+        population = villages.to_numpy()
+        fertility_rate = self.get_fertility_rate(villages.index).to_numpy()
+        births = fertility_rate * population[:, [0]]
 
-        mortality_rate = self.get_mortality_rate(villages.index)
-        deaths = mortality_rate * villages
-        villages += births - deaths
+        mortality_rate = self.get_mortality_rate(villages.index).to_numpy()
+        deaths = mortality_rate * population
 
+        villages = pd.DataFrame(
+            population + (births - deaths), index=villages.index, columns=villages.columns
+        )
         villages = round_stochastic(villages, self.randomness, "population_size")
         self.population_view.update(villages)
 
@@ -141,33 +153,45 @@ class Demographics(Component):
         #  confusing and will likely lead to bugs in the future if not fixed.
         female_fertility_rate = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="female_fertility",
-            **self.configuration.fertility_rate.to_dict(),
-        ).rename(Columns.FEMALE_POPULATION_SIZE)
+            **self._fertility_rate_parameters,
+        )
 
         male_fertility_rate = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="male_fertility",
-            **self.configuration.fertility_rate.to_dict(),
-        ).rename(Columns.MALE_POPULATION_SIZE)
-        return pd.concat([female_fertility_rate, male_fertility_rate], axis=1)
+            **self._fertility_rate_parameters,
+        )
+        return pd.DataFrame(
+            {
+                Columns.FEMALE_POPULATION_SIZE: female_fertility_rate.to_numpy(),
+                Columns.MALE_POPULATION_SIZE: male_fertility_rate.to_numpy(),
+            },
+            index=index,
+        )
 
     def mortality_rate_source(self, index: pd.Index) -> pd.DataFrame:
         female_mortality_rate = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="female_mortality",
-            **self.configuration.mortality_rate.to_dict(),
-        ).rename(Columns.FEMALE_POPULATION_SIZE)
+            **self._mortality_rate_parameters,
+        )
         male_mortality_rate = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="male_mortality",
-            **self.configuration.mortality_rate.to_dict(),
-        ).rename(Columns.MALE_POPULATION_SIZE)
-        return pd.concat([female_mortality_rate, male_mortality_rate], axis=1)
+            **self._mortality_rate_parameters,
+        )
+        return pd.DataFrame(
+            {
+                Columns.FEMALE_POPULATION_SIZE: female_mortality_rate.to_numpy(),
+                Columns.MALE_POPULATION_SIZE: male_mortality_rate.to_numpy(),
+            },
+            index=index,
+        )
 
     def total_population_source(self, index: pd.Index) -> pd.Series:
         population = self.population_view.get(index)[
@@ -1,8 +1,8 @@
 import dataclasses
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from scipy import stats
 from vivarium import Component
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
@@ -15,6 +15,7 @@ from village_simulator.constants import Columns, Pipelines
 from village_simulator.constants.paths import EFFECT_OF_TEMPERATURE_ON_WHEAT_YIELD
 from village_simulator.simulation.components.resources import Resource
 from village_simulator.simulation.constants import ONE_YEAR
+from village_simulator.simulation.distributions import normal_ppf
 from village_simulator.simulation.utilities import get_next_annual_event_date
 
 WHEAT_SOWING_DATE = {"month": 10, "day": 15}
@@ -100,14 +101,16 @@ class Wheat(Resource):
 
         arable_land = self.population_view.subview([Columns.ARABLE_LAND]).get(pop_data.index)
 
-        init_data = pd.DataFrame(
-            0.0, columns=[Columns.PROJECTED_WHEAT_HARVEST], index=pop_data.index
-        )
-        init_data.loc[
-            arable_land.index, Columns.PROJECTED_WHEAT_HARVEST
-        ] = self.initialize_projected_yield(arable_land.squeeze(axis=1))
+        projected_yield = np.zeros(len(pop_data.index))
+        projected_yield[
+            pop_data.index.get_indexer(arable_land.index)
+        ] = self.initialize_projected_yield(arable_land.squeeze(axis=1)).to_numpy()
 
-        self.population_view.update(init_data)
+        self.population_view.update(
+            pd.Series(
+                projected_yield, index=pop_data.index, name=Columns.PROJECTED_WHEAT_HARVEST
+            )
+        )
 
     def on_time_step(self, event: Event) -> None:
         """
@@ -155,6 +158,9 @@ class Wheat(Resource):
         )
 
     def register_consumption(self, builder):
+        self._consumption_parameters = (
+            self.configuration.annual_per_capita_consumption.to_dict()
+        )
         return builder.value.register_value_producer(
             self._consumption_pipeline,
             self.consumption_rate_source,
@@ -242,7 +248,7 @@ class Wheat(Resource):
         """
         land_cultivation_per_capita = self.randomness.sample_from_distribution(
             arable_land.index,
-            stats.norm,
+            ppf=normal_ppf,
             additional_key="land_cultivation",
             **self.configuration.land_cultivation_per_capita.to_dict(),
         )
@@ -252,22 +258,21 @@ class Wheat(Resource):
 
         projected_yield = land_under_cultivation * self.randomness.sample_from_distribution(
             land_under_cultivation.index,
-            stats.norm,
+            ppf=normal_ppf,
             additional_key="projected_yield",
             **self.configuration.land_productivity.to_dict(),
         )
         return projected_yield.rename(Columns.PROJECTED_WHEAT_HARVEST)
 
     def get_natural_consumption_rate(self, index: pd.Index) -> pd.Series:
+        consumption_per_capita = self.randomness.sample_from_distribution(
+            index,
+            ppf=normal_ppf,
+            additional_key=f"{self.resource}.consumption",
+            **self._consumption_parameters,
+        )
         natural_consumption_rate = from_yearly(
-            self.total_population(index)
-            * self.randomness.sample_from_distribution(
-                index,
-                distribution=stats.norm,
-                additional_key=f"{self.resource}.consumption",
-                **self.configuration.annual_per_capita_consumption.to_dict(),
-            ),
-            self.step_size(),
+            self.get_total_from_per_capita(consumption_per_capita), self.step_size()
         )
         return natural_consumption_rate
 
@@ -1,6 +1,6 @@
-import itertools
 from typing import List
 
+import numpy as np
 import pandas as pd
 from vivarium import Component
 from vivarium.framework.engine import Builder
@@ -63,9 +63,8 @@ class Map(Component):
         else:
             width = self.configuration.dimensions.x
             height = self.configuration.dimensions.y
-            coordinates = pd.DataFrame(
-                itertools.product(range(width), range(height)), columns=[Columns.X, Columns.Y]
-            )
+            x, y = np.meshgrid(np.arange(width), np.arange(height), indexing="ij")
+            coordinates = pd.DataFrame({Columns.X: x.ravel(), Columns.Y: y.ravel()})
 
             self.register_simulants(coordinates[self.key_columns])
             self.population_view.update(coordinates)
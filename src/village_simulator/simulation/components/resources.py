@@ -1,13 +1,14 @@
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from scipy import stats
 from vivarium import Component
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
 from vivarium.framework.population import SimulantData
 
 from village_simulator.constants import Columns, Pipelines
+from village_simulator.simulation.distributions import normal_ppf
 
 
 class Resource(Component):
@@ -75,6 +76,9 @@ class Resource(Component):
     #################
 
     def register_accumulation(self, builder):
+        self._accumulation_parameters = (
+            self.configuration.annual_per_capita_accumulation.to_dict()
+        )
         return builder.value.register_rate_producer(
             self._accumulation_pipeline,
             self.accumulation_rate_source,
@@ -83,6 +87,9 @@ class Resource(Component):
         )
 
     def register_consumption(self, builder):
+        self._consumption_parameters = (
+            self.configuration.annual_per_capita_consumption.to_dict()
+        )
         return builder.value.register_rate_producer(
             self._consumption_pipeline,
             self.consumption_rate_source,
@@ -102,20 +109,23 @@ class Resource(Component):
         :return:
         """
         is_village = self.population_view.subview([Columns.IS_VILLAGE]).get(pop_data.index)
-        village_index = is_village[is_village].index
-        stores = pd.Series(0.0, index=pop_data.index, name=self._stores_column)
-
-        stores[village_index] = self.total_population(
-            village_index
-        ) * self.randomness.sample_from_distribution(
-            village_index,
-            distribution=stats.norm,
-            additional_key=self.resource,
-            **self.configuration.initial_per_capita_stores.to_dict(),
+        village_index = is_village.index.take(np.flatnonzero(is_village.to_numpy()))
+
+        stores = np.zeros(len(pop_data.index))
+        stores[pop_data.index.get_indexer(village_index)] = (
+            self.total_population(village_index)
+            * self.randomness.sample_from_distribution(
+                village_index,
+                ppf=normal_ppf,
+                additional_key=self.resource,
+                **self.configuration.initial_per_capita_stores.to_dict(),
+            )
+        ).to_numpy()
+
+        self.population_view.update(
+            pd.Series(stores, index=pop_data.index, name=self._stores_column)
         )
 
-        self.population_view.update(stores)
-
     def on_time_step(self, event: Event) -> None:
         """
         Consume and accumulate resource.
@@ -124,9 +134,13 @@ class Resource(Component):
         :return:
         """
         resource = self.population_view.get(event.index)[self._stores_column]
-        resource -= self.get_consumption(resource.index)
-        resource += self.get_accumulation(resource.index)
-        self.population_view.update(resource)
+
+        stores = resource.to_numpy(copy=True)
+        stores -= self.get_consumption(resource.index).to_numpy()
+        stores += self.get_accumulation(resource.index).to_numpy()
+        self.population_view.update(
+            pd.Series(stores, index=resource.index, name=self._stores_column)
+        )
 
     ####################
     # Pipeline sources #
@@ -144,9 +158,9 @@ class Resource(Component):
         """
         accumulation_per_capita = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key=f"{self.resource}.accumulation",
-            **self.configuration.annual_per_capita_accumulation.to_dict(),
+            **self._accumulation_parameters,
         )
         return self.get_total_from_per_capita(accumulation_per_capita)
 
@@ -162,9 +176,9 @@ class Resource(Component):
         """
         consumption_per_capita = self.randomness.sample_from_distribution(
             index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key=f"{self.resource}.consumption",
-            **self.configuration.annual_per_capita_consumption.to_dict(),
+            **self._consumption_parameters,
         )
         return self.get_total_from_per_capita(consumption_per_capita)
 
@@ -173,5 +187,15 @@ class Resource(Component):
     ##################
 
     def get_total_from_per_capita(self, per_capita_value: pd.Series) -> pd.Series:
-        """Scales the per capita value to a raw value."""
-        return self.total_population(per_capita_value.index) * per_capita_value
+        """
+        Scales the per capita value to a raw value.
+
+        Pipelines return values in the same order as the index they are called
+        with, so the per capita value is scaled on the raw arrays without
+        aligning on the index.
+        """
+        total_population = self.total_population(per_capita_value.index)
+        return pd.Series(
+            total_population.to_numpy() * per_capita_value.to_numpy(),
+            index=per_capita_value.index,
+        )
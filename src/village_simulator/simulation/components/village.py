@@ -2,7 +2,6 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 from vivarium import Component
 from vivarium.framework.engine import Builder
 from vivarium.framework.population import SimulantData
@@ -12,6 +11,7 @@ from village_simulator.constants.paths import (
     EFFECT_OF_TERRAIN_ON_ARABLE_LAND,
     EFFECT_OF_TERRAIN_ON_VILLAGE,
 )
+from village_simulator.simulation.distributions import normal_ppf
 
 
 class Village(Component):
@@ -77,13 +77,14 @@ class Village(Component):
         )
 
         arable_land_data = self.effect_of_terrain_on_arable_land(pop_data.index)
-        initial_values[Columns.ARABLE_LAND] = self.randomness.sample_from_distribution(
+        arable_land = self.randomness.sample_from_distribution(
             pop_data.index,
-            stats.norm,
+            ppf=normal_ppf,
             additional_key="arable_land",
             loc=arable_land_data["loc"],
             scale=arable_land_data["scale"],
-        ).clip(lower=0.0, upper=1.0)
+        ).to_numpy()
+        initial_values[Columns.ARABLE_LAND] = np.clip(arable_land, 0.0, 1.0, out=arable_land)
 
         self.population_view.update(initial_values)
 
@@ -2,15 +2,18 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 from vivarium import Component
 from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event
 from vivarium.framework.population import SimulantData
 
 from village_simulator.constants import Columns, Pipelines
-from village_simulator.simulation.distributions import stretched_truncnorm_ppf
-from village_simulator.simulation.utilities import get_value_from_annual_cycle
+from village_simulator.simulation.distributions import (
+    gamma_ppf,
+    normal_ppf,
+    stretched_truncnorm_ppf,
+)
+from village_simulator.simulation.utilities import AnnualCycle
 
 RAINFALL_SEASONALITY_MIN = 0.1
 RAINFALL_SEASONALITY_MAX = 1.0
@@ -73,6 +76,35 @@ class Weather(Component):
     def setup(self, builder: Builder) -> None:
         self.configuration = builder.configuration.weather
         self.randomness = builder.randomness.get_stream(self.name)
+        # Regional weather values are a single draw shared by every tile
+        self._regional_index = pd.Index([0])
+        # Buffer for the weather columns, reused across time steps. The
+        # population view copies updates into the state table, so it is safe
+        # to overwrite it each step.
+        self._weather_buffer = np.empty((0, len(self.columns_created)))
+
+        # Read the parameters out of the configuration tree once rather than
+        # traversing it on every time step
+        temperature = self.configuration.temperature
+        self._temperature_mean = float(temperature.mean)
+        self._temperature_stochastic_variability = float(temperature.stochastic_variability)
+        self._temperature_local_variability = float(temperature.local_variability)
+
+        rainfall = self.configuration.rainfall
+        self._dry_probability = float(rainfall.dry_probability)
+        self._gamma_shape_parameter = float(rainfall.gamma_shape_parameter)
+        self._gamma_scale_parameter = float(rainfall.gamma_scale_parameter)
+        self._rainfall_local_variability = float(rainfall.local_variability)
+
+        self._seasonal_temperature_shift = AnnualCycle(
+            amplitude=float(temperature.seasonality.amplitude),
+            min_date=temperature.seasonality.min_date,
+        )
+        self._aridity_factor = AnnualCycle(
+            min=float(rainfall.seasonality.min),
+            max=float(rainfall.seasonality.max),
+            min_date=rainfall.seasonality.min_date,
+        )
 
         self.get_temperature = builder.value.register_value_producer(
             Pipelines.TEMPERATURE, self.temperature_source
@@ -92,71 +124,72 @@ class Weather(Component):
     def on_time_step_prepare(self, event: Event) -> None:
         temperature = self.get_temperature(event)
         rainfall = self.get_rainfall(event)
-        self.population_view.update(pd.concat([temperature, rainfall], axis=1))
+
+        if len(self._weather_buffer) != len(temperature):
+            self._weather_buffer = np.empty((len(temperature), len(self.columns_created)))
+        self._weather_buffer[:, 0] = temperature.to_numpy()
+        self._weather_buffer[:, 1] = rainfall.to_numpy()
+
+        self.population_view.update(
+            pd.DataFrame(
+                self._weather_buffer,
+                index=temperature.index,
+                columns=self.columns_created,
+                copy=False,
+            )
+        )
 
     ####################
     # Pipeline sources #
     ####################
 
     def temperature_source(self, event: Event) -> pd.Series:
-        config = self.configuration.temperature
-
-        seasonal_temperature_shift = get_value_from_annual_cycle(
-            event.time,
-            amplitude=config.seasonality.amplitude,
-            min_date=config.seasonality.min_date,
-        )
-        expected_temperature = config.mean + seasonal_temperature_shift
-        regional_temperature = self.randomness.sample_from_distribution(
-            pd.Index([0]),
-            distribution=stats.norm,
-            additional_key="regional_temperature",
+        seasonal_temperature_shift = self._seasonal_temperature_shift(event.time)
+        expected_temperature = self._temperature_mean + seasonal_temperature_shift
+        regional_temperature = normal_ppf(
+            self._get_regional_draw("regional_temperature"),
             loc=expected_temperature,
-            scale=config.stochastic_variability,
-        )[0]
+            scale=self._temperature_stochastic_variability,
+        )
 
         temperatures = self.randomness.sample_from_distribution(
             event.index,
-            distribution=stats.norm,
+            ppf=normal_ppf,
             additional_key="temperature",
             loc=regional_temperature,
-            scale=config.local_variability,
+            scale=self._temperature_local_variability,
         )
         return temperatures
 
     def rainfall_source(self, event: Event) -> pd.Series:
-        config = self.configuration.rainfall
-
-        aridity_factor = get_value_from_annual_cycle(
-            event.time,
-            min=config.seasonality.min,
-            max=config.seasonality.max,
-            min_date=config.seasonality.min_date,
-        )
-        dry_probability = 1 - aridity_factor * (1 - config.dry_probability)
-        is_dry_propensity = self.randomness.get_draw(
-            pd.Index([0]),
-            additional_key="is_dry",
-        )[0]
+        aridity_factor = self._aridity_factor(event.time)
+        dry_probability = 1 - aridity_factor * (1 - self._dry_probability)
+        is_dry_propensity = self._get_regional_draw("is_dry")
 
         if is_dry_propensity < dry_probability:
             return pd.Series(0.0, index=event.index)
 
-        scale = aridity_factor * config.gamma_scale_parameter
+        scale = aridity_factor * self._gamma_scale_parameter
 
-        regional_rainfall = self.randomness.sample_from_distribution(
-            pd.Index([0]),
-            distribution=stats.gamma,
-            additional_key="regional_rainfall",
-            a=config.gamma_shape_parameter,
+        regional_rainfall = gamma_ppf(
+            self._get_regional_draw("regional_rainfall"),
+            shape=self._gamma_shape_parameter,
             scale=scale,
-        )[0]
+        )
 
         rainfall = self.randomness.sample_from_distribution(
             event.index,
             ppf=stretched_truncnorm_ppf,
             additional_key="rainfall",
             loc=regional_rainfall,
-            scale=config.local_variability,
+            scale=self._rainfall_local_variability,
         )
         return rainfall
+
+    ##################
+    # Helper methods #
+    ##################
+
+    def _get_regional_draw(self, additional_key: str) -> float:
+        """Get a single uniform draw for a value shared by the whole region."""
+        return self.randomness.get_draw(self._regional_index, additional_key).to_numpy()[0]
@@ -1,8 +1,77 @@
+from functools import lru_cache
 from typing import Tuple, Union
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import special
+
+# The standard normal cdf at the upper truncation point of the stretched
+# truncated normal distribution, 5 standard deviations above its mean
+_UPPER_TRUNCATION_CDF = special.ndtr(5.0)
+
+
+def normal_ppf(
+    quantiles: Union[float, np.ndarray, pd.Series],
+    loc: Union[float, np.ndarray, pd.Series] = 0.0,
+    scale: Union[float, np.ndarray, pd.Series] = 1.0,
+) -> Union[float, np.ndarray]:
+    """
+    Return the inverse of the cumulative distribution function of a normal
+    distribution.
+
+    This is equivalent to `scipy.stats.norm.ppf`, but calls the underlying
+    special function directly to avoid the overhead of scipy's distribution
+    machinery.
+
+    Parameters
+    ----------
+    quantiles
+        The quantiles at which to compute the inverse of the cumulative
+        distribution function.
+    loc
+        The mean of the distribution.
+    scale
+        The standard deviation of the distribution.
+
+    Returns
+    -------
+    The inverse of the cumulative distribution function of a normal
+    distribution.
+    """
+    # vivarium wraps the samples in a Series itself, so work on the underlying
+    # arrays rather than doing Series arithmetic
+    return special.ndtri(np.asarray(quantiles)) * np.asarray(scale) + np.asarray(loc)
+
+
+def gamma_ppf(
+    quantiles: Union[float, np.ndarray, pd.Series],
+    shape: Union[float, np.ndarray, pd.Series],
+    scale: Union[float, np.ndarray, pd.Series] = 1.0,
+) -> Union[float, np.ndarray, pd.Series]:
+    """
+    Return the inverse of the cumulative distribution function of a gamma
+    distribution.
+
+    This is equivalent to `scipy.stats.gamma.ppf`, but calls the underlying
+    special function directly to avoid the overhead of scipy's distribution
+    machinery.
+
+    Parameters
+    ----------
+    quantiles
+        The quantiles at which to compute the inverse of the cumulative
+        distribution function.
+    shape
+        The shape parameter of the distribution.
+    scale
+        The scale parameter of the distribution.
+
+    Returns
+    -------
+    The inverse of the cumulative distribution function of a gamma
+    distribution.
+    """
+    return special.gammaincinv(shape, quantiles) * scale
 
 
 def stretched_truncnorm_ppf(
@@ -40,23 +109,110 @@ def stretched_truncnorm_ppf(
     truncated normal distribution.
     """
     quantiles, loc, scale = _format_distribution_parameters(quantiles, loc, scale)
-    quantiles_values = quantiles.values[:, None]
 
-    # Temporarily set loc to 1.0 where it is 0.0 to avoid divide by zero errors
-    is_non_zero = loc > 0.0
-    modified_loc = np.where(is_non_zero, loc, 1.0)
-    modified_scale = scale * modified_loc
-    a = -modified_loc / modified_scale
+    if loc.size == 1 and scale.size == 1:
+        # All distribution parameters are scalars, so the samples have the same
+        # shape as quantiles and don't need to be broadcast into a DataFrame
+        loc, scale = loc.item(), scale.item()
+        if loc > 0.0:
+            values = _truncnorm_ppf(quantiles.values, _get_lower_cdf(scale), loc, scale * loc)
+        else:
+            values = np.zeros(len(quantiles))
+        return _format_samples(values, quantiles.index)
+
+    if loc.shape[1] == 1 and scale.shape[1] == 1:
+        # The distribution parameters are column vectors, so each quantile has
+        # its own parameters and the samples have the same shape as quantiles.
+        # Only evaluate the ppf where loc is non-zero, since the rest are 0.0
+        loc = np.broadcast_to(loc[:, 0], quantiles.shape)
+        scale = np.broadcast_to(scale[:, 0], quantiles.shape)
+        non_zero_rows = np.flatnonzero(loc > 0.0)
+        non_zero_loc, non_zero_scale = loc[non_zero_rows], scale[non_zero_rows]
 
-    values = stats.truncnorm.ppf(
-        quantiles_values, a=a, b=5, loc=modified_loc, scale=modified_scale
+        values = np.zeros(len(quantiles))
+        values[non_zero_rows] = _truncnorm_ppf(
+            quantiles.values[non_zero_rows],
+            special.ndtr(-1.0 / non_zero_scale),
+            non_zero_loc,
+            non_zero_scale * non_zero_loc,
+        )
+        return _format_samples(values, quantiles.index)
+
+    # The distribution parameters are row vectors, so each column of the
+    # samples has its own parameters. Only evaluate the ppf in columns where loc
+    # is non-zero, since the rest are 0.0
+    num_columns = max(loc.shape[1], scale.shape[1])
+    loc = np.broadcast_to(loc, (1, num_columns))
+    scale = np.broadcast_to(scale, (1, num_columns))
+    non_zero_columns = np.flatnonzero(loc[0] > 0.0)
+    non_zero_loc, non_zero_scale = loc[:, non_zero_columns], scale[:, non_zero_columns]
+
+    values = np.zeros((len(quantiles), num_columns))
+    values[:, non_zero_columns] = _truncnorm_ppf(
+        quantiles.values[:, None],
+        special.ndtr(-1.0 / non_zero_scale),
+        non_zero_loc,
+        non_zero_scale * non_zero_loc,
     )
 
-    # Set values to 0.0 where loc is 0.0
-    values = np.where(np.broadcast_to(is_non_zero, values.shape), values, 0.0)
+    return _format_samples(values, quantiles.index)
+
+
+def _truncnorm_ppf(
+    quantiles: np.ndarray,
+    lower_cdf: Union[float, np.ndarray],
+    loc: Union[float, np.ndarray],
+    scale: Union[float, np.ndarray],
+) -> np.ndarray:
+    """
+    Return the inverse of the cumulative distribution function of a normal
+    distribution truncated below and 5 standard deviations above its mean,
+    where `lower_cdf` is the standard normal cdf at the lower truncation point.
+
+    This inverts the cdf directly rather than using scipy.stats.truncnorm,
+    whose ppf carries a lot of per-call dispatch overhead.
+    """
+    # Apply the transformation in place to avoid allocating a temporary array
+    # for each intermediate step
+    values = np.empty(np.broadcast_shapes(*map(np.shape, (quantiles, lower_cdf, loc, scale))))
+    np.multiply(quantiles, _UPPER_TRUNCATION_CDF - lower_cdf, out=values)
+    values += lower_cdf
+    special.ndtri(values, out=values)
+    values *= scale
+    values += loc
+    return values
+
 
-    samples = pd.DataFrame(values, index=quantiles.index)
-    return samples.squeeze()
+@lru_cache
+def _get_lower_cdf(scale: float) -> float:
+    """
+    Return the standard normal cdf at the lower truncation point of a stretched
+    truncated normal distribution, -loc / (scale * loc) = -1 / scale.
+
+    This is cached since the relative scale is usually a fixed configuration
+    value that is sampled from on every time step.
+    """
+    # Divide as a numpy float, so that a zero scale follows numpy's floating point
+    # error handling, like the array parameters, rather than always raising
+    return special.ndtr(-1.0 / np.float64(scale))
+
+
+def _format_samples(
+    values: np.ndarray, index: pd.Index
+) -> Union[float, pd.Series, pd.DataFrame]:
+    """
+    Wrap samples in a Series if they are one-dimensional or a DataFrame if they
+    are two-dimensional, squeezing out any dimensions of size 1.
+
+    One-dimensional samples are named 0, like the single column of the
+    equivalent DataFrame.
+    """
+    if values.ndim == 1:
+        # The shape is already known, so only a single sample needs squeezing
+        if len(values) == 1:
+            return values.item()
+        return pd.Series(values, index=index, name=0)
+    return pd.DataFrame(values, index=index).squeeze()
 
 
 def _format_distribution_parameters(
@@ -64,7 +220,8 @@ def _format_distribution_parameters(
 ) -> Tuple[pd.Series, ...]:
     """
     Ensures quantiles is a Series and all distribution parameters are 2d numpy
-    arrays.
+    arrays. Scalar parameters become arrays of shape (1, 1), which broadcast
+    against the non-scalar parameters without being expanded to their shape.
 
     Throws a value error if any of the non-scalar distribution parameters do not
     have the same dimensions, or if any of them are not one-dimensional.
@@ -81,30 +238,25 @@ def _format_distribution_parameters(
     """
     quantiles = pd.Series(quantiles) if not isinstance(quantiles, pd.Series) else quantiles
 
-    parameter_arrays = [v.shape for v in distribution_parameters if isinstance(v, np.ndarray)]
-    if parameter_arrays:
-        array_shape = parameter_arrays[0]
-        if not all([shape == array_shape for shape in parameter_arrays]):
-            raise ValueError(
-                "All distribution parameters must have the same shape or be scalars."
-            )
-        if array_shape[1] == 1 and array_shape[0] != len(quantiles):
-            raise ValueError(
-                "If distribution parameters are column vectors, they must have"
-                "the same length as quantiles."
-            )
-        if array_shape[0] != 1 and array_shape[1] != 1:
-            raise ValueError(
-                "All distribution parameters must be one-dimensional or be scalars."
-            )
-    else:
-        array_shape = (1, 1)
-
-    distribution_parameters = (
-        np.full(array_shape, parameter_value)
-        if not isinstance(parameter_value, np.ndarray)
-        else parameter_value
-        for parameter_value in distribution_parameters
-    )
+    parameter_shapes = {v.shape for v in distribution_parameters if isinstance(v, np.ndarray)}
+    if not parameter_shapes:
+        # All distribution parameters are scalars, so there is nothing to check
+        return quantiles, *[np.full((1, 1), value) for value in distribution_parameters]
+
+    if len(parameter_shapes) > 1:
+        raise ValueError(
+            "All distribution parameters must have the same shape or be scalars."
+        )
+    (array_shape,) = parameter_shapes
+    if array_shape[1] == 1 and array_shape[0] != len(quantiles):
+        raise ValueError(
+            "If distribution parameters are column vectors, they must have"
+            "the same length as quantiles."
+        )
+    if array_shape[0] != 1 and array_shape[1] != 1:
+        raise ValueError("All distribution parameters must be one-dimensional or be scalars.")
 
-    return quantiles, *distribution_parameters
+    return quantiles, *[
+        value if isinstance(value, np.ndarray) else np.full((1, 1), value)
+        for value in distribution_parameters
+    ]
@@ -1,4 +1,5 @@
-from typing import Union
+import math
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,19 @@ from vivarium.framework.time import Time
 
 from village_simulator.simulation.constants import ONE_YEAR
 
+_TWO_PI = 2 * math.pi
+_ONE_YEAR_NANOSECONDS = ONE_YEAR.value
+
+
+def _round_array_stochastic(
+    values: np.ndarray, rounding_propensities: np.ndarray
+) -> np.ndarray:
+    # Round up in place on the floored values rather than allocating a new
+    # array for the sum
+    rounded_values = np.floor(values)
+    rounded_values += rounding_propensities < values - rounded_values
+    return rounded_values.astype(int)
+
 
 def _round_series_stochastic(
     values: pd.Series, randomness_stream: RandomnessStream, additional_key: str = ""
@@ -16,10 +30,11 @@ def _round_series_stochastic(
     rounding_propensities = randomness_stream.get_draw(
         values.index, additional_key=f"{additional_key}_stochastic_rounding"
     )
-    floored_values = np.floor(values)
-    thresholds = values - floored_values
-    values = (rounding_propensities < thresholds) + floored_values
-    return values.astype(int)
+    return pd.Series(
+        _round_array_stochastic(values.to_numpy(), rounding_propensities.to_numpy()),
+        index=values.index,
+        name=values.name,
+    )
 
 
 def round_stochastic(
@@ -28,11 +43,18 @@ def round_stochastic(
     additional_key: str = "",
 ) -> Union[pd.DataFrame, pd.Series]:
     if isinstance(values, pd.DataFrame):
-        return values.apply(
-            lambda column: _round_series_stochastic(
-                column, randomness_stream, f"{column.name}_{additional_key}"
+        # Round each column on the underlying array rather than applying the
+        # Series rounding to each column
+        unrounded_values = values.to_numpy()
+        rounded_values = np.empty(values.shape, dtype=int)
+        for i, column in enumerate(values.columns):
+            rounding_propensities = randomness_stream.get_draw(
+                values.index, additional_key=f"{column}_{additional_key}_stochastic_rounding"
             )
-        )
+            rounded_values[:, i] = _round_array_stochastic(
+                unrounded_values[:, i], rounding_propensities.to_numpy()
+            )
+        return pd.DataFrame(rounded_values, index=values.index, columns=values.columns)
     else:
         return _round_series_stochastic(values, randomness_stream, additional_key)
 
@@ -78,6 +100,54 @@ def get_value_from_annual_cycle(
     elif isinstance(min_date, ConfigTree):
         min_date = get_annual_time_stamp(time.year, min_date)
 
-    distance_from_minimum = (time - min_date) / ONE_YEAR
-    value = mean - amplitude * np.cos(2 * np.pi * distance_from_minimum)
+    # Divide the nanosecond counts directly rather than dividing Timedeltas
+    distance_from_minimum = (time - min_date).value / _ONE_YEAR_NANOSECONDS
+    # The distance is a scalar, so math.cos avoids numpy's ufunc dispatch
+    value = mean - amplitude * math.cos(_TWO_PI * distance_from_minimum)
     return value
+
+
+class AnnualCycle:
+    """
+    A value that follows an annual cycle, as computed by
+    `get_value_from_annual_cycle`.
+
+    The value for each day of the year is computed once on construction, so
+    that evaluating the cycle at midnight on any date is a table lookup.
+    """
+
+    def __init__(
+        self,
+        mean: float = 0.0,
+        amplitude: float = 1.0,
+        min: Optional[float] = None,
+        max: Optional[float] = None,
+        min_date: Union[Time, ConfigTree] = None,
+    ):
+        self._parameters = {
+            "mean": mean,
+            "amplitude": amplitude,
+            "min": min,
+            "max": max,
+            "min_date": min_date,
+        }
+
+        # A fixed minimum date doesn't recur annually, so it can't be tabulated
+        self._daily_values = None
+        if not isinstance(min_date, pd.Timestamp):
+            # Tabulate a leap year and a common year separately, since the day
+            # of year of dates after February 28 depends on it
+            self._daily_values = {
+                is_leap_year: np.array(
+                    [
+                        get_value_from_annual_cycle(date, **self._parameters)
+                        for date in pd.date_range(f"{year}-01-01", f"{year}-12-31")
+                    ]
+                )
+                for is_leap_year, year in [(True, 2000), (False, 2001)]
+            }
+
+    def __call__(self, time: Time) -> float:
+        if self._daily_values is not None and time == time.normalize():
+            return self._daily_values[time.is_leap_year][time.dayofyear - 1]
+        return get_value_from_annual_cycle(time, **self._parameters)
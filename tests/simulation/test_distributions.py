@@ -1,28 +1,15 @@
-from typing import Dict, Union
-
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import stats
 
 from village_simulator.simulation.distributions import (
     _format_distribution_parameters,
+    gamma_ppf,
+    normal_ppf,
     stretched_truncnorm_ppf,
 )
 
-
-def _kwargs_list_to_series(
-    kwargs: Dict[str, Union[float, list]]
-) -> Dict[str, Union[float, pd.Series]]:
-    """
-    Convert a dictionary of kwargs to a dictionary of kwargs where all values
-    that were previously lists are now Series.
-    """
-    return {
-        key: pd.Series(value) if isinstance(value, list) else value
-        for key, value in kwargs.items()
-    }
-
-
 SCALAR_DIST_PARAMS = [(stretched_truncnorm_ppf, {"loc": 4.0, "scale": 1.0})]
 
 
@@ -106,6 +93,66 @@ def test_format_distribution_parameters(args, message):
         _format_distribution_parameters(pd.Series([0.5, 0.99, 0.63, 0.01]), *args)
 
 
+def test_format_distribution_parameters_scalars_not_expanded():
+    """
+    Test that scalar parameters are formatted as arrays of shape (1, 1) rather
+    than being expanded to the shape of the non-scalar parameters
+    """
+    column_vector = np.array([[0.3], [0.6], [0.1], [0.2]])
+    _, scalar, vector = _format_distribution_parameters(
+        pd.Series([0.5, 0.99, 0.63, 0.01]), 4.0, column_vector
+    )
+
+    assert scalar.shape == (1, 1)
+    assert scalar[0, 0] == 4.0
+    assert vector is column_vector
+
+
+###################
+# Test normal_ppf #
+###################
+
+
+@pytest.mark.parametrize(
+    "loc, scale",
+    [
+        (0.0, 1.0),
+        (0.05, 0.01),
+        (np.array([1.0, -3.0, 10.0, 0.5]), np.array([0.1, 2.0, 0.5, 1.0])),
+    ],
+)
+def test_normal_ppf_matches_scipy(loc, scale):
+    """Test that the function is equivalent to scipy.stats.norm.ppf"""
+    quantiles = pd.Series([0.01, 0.3, 0.5, 0.99])
+
+    actual = normal_ppf(quantiles, loc=loc, scale=scale)
+
+    np.testing.assert_allclose(actual, stats.norm.ppf(quantiles, loc=loc, scale=scale))
+
+
+##################
+# Test gamma_ppf #
+##################
+
+
+@pytest.mark.parametrize(
+    "shape, scale",
+    [
+        (0.9902, 1.0),
+        (2.5, 15.0),
+        (np.array([0.5, 1.0, 3.0, 0.9902]), np.array([1.0, 15.0, 0.5, 2.0])),
+    ],
+)
+def test_gamma_ppf_matches_scipy(shape, scale):
+    """Test that the function is equivalent to scipy.stats.gamma.ppf"""
+    quantiles = pd.Series([0.01, 0.3, 0.5, 0.99])
+
+    actual = gamma_ppf(quantiles, shape=shape, scale=scale)
+
+    assert isinstance(actual, pd.Series)
+    np.testing.assert_allclose(actual, stats.gamma.ppf(quantiles, a=shape, scale=scale))
+
+
 ################################
 # Test stretched_truncnorm_ppf #
 ################################
@@ -146,3 +193,26 @@ def test_stretched_truncnorm_ppf_loc_some_zero_2d():
     actual = stretched_truncnorm_ppf(quantiles, loc=loc.values[None, :])
 
     assert actual.loc[:, loc[loc == 0.0].index].eq(0.0).all().all()
+
+
+@pytest.mark.parametrize(
+    "loc, scale",
+    [
+        (4.0, 0.05),
+        (np.array([[5.4], [0.5], [4.1], [12.0]]), 0.05),
+        (np.array([[1.0, 9.0, 5.0]]), np.array([[0.1, 0.5, 1.0]])),
+    ],
+)
+def test_stretched_truncnorm_ppf_matches_scipy_truncnorm(loc, scale):
+    """
+    Test that the function matches scipy.stats.truncnorm truncated at 0 and 5
+    standard deviations above the mean
+    """
+    quantiles = pd.Series([0.01, 0.3, 0.5, 0.99])
+
+    actual = stretched_truncnorm_ppf(quantiles, loc=loc, scale=scale)
+
+    expected = stats.truncnorm.ppf(
+        quantiles.values[:, None], a=-1.0 / scale, b=5, loc=loc, scale=scale * loc
+    )
+    np.testing.assert_allclose(actual, expected.squeeze())
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from vivarium import ConfigTree
+
+from village_simulator.simulation.utilities import (
+    AnnualCycle,
+    _round_array_stochastic,
+    get_value_from_annual_cycle,
+)
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {"amplitude": 15.0, "min_date": ConfigTree({"month": 1, "day": 15})},
+        {"min": 0.1, "max": 1.0, "min_date": ConfigTree({"month": 8, "day": 15})},
+        {"mean": 2.0, "amplitude": 3.0},
+    ],
+)
+@pytest.mark.parametrize(
+    "dates",
+    [
+        pd.date_range("2000-01-01", "2001-12-31"),
+        pd.date_range("2003-02-27 12:00", periods=8, freq="6h"),
+    ],
+)
+def test_annual_cycle_matches_get_value_from_annual_cycle(parameters, dates):
+    """
+    Test that the tabulated annual cycle gives the same values as computing
+    them directly, both for leap and common years and for times that are not at
+    midnight
+    """
+    annual_cycle = AnnualCycle(**parameters)
+
+    for date in dates:
+        assert annual_cycle(date) == get_value_from_annual_cycle(date, **parameters)
+
+
+def test_round_array_stochastic():
+    """
+    Test that values are rounded up exactly when the rounding propensity is
+    less than their fractional part
+    """
+    values = np.array([1.25, 1.25, 7.0, -0.5, -0.5])
+    rounding_propensities = np.array([0.2, 0.3, 0.99, 0.4, 0.6])
+
+    actual = _round_array_stochastic(values, rounding_propensities)
+
+    np.testing.assert_array_equal(actual, np.array([2, 1, 7, 0, -1]))